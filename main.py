@@ -1,18 +1,30 @@
 #!/usr/bin/env python3
 
 import os
-import requests
 import json
 import time
 from datetime import datetime, timedelta
-from telegram import Bot
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
-from dotenv import load_dotenv
 
-load_dotenv('/home/pi/commute-app/.env')
+# requests, telegram and dotenv are imported lazily - they are slow to load
+# on a Pi and not every run needs all of them.
+
+ENV_FILE = '/home/pi/commute-app/.env'
+CACHE_FILE = '.journey_cache.json'
+
+def load_env():
+    """Load .env if python-dotenv is available"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(ENV_FILE)
 
 class CommutePredictor:
-    def __init__(self, config_file='config.json'):
+    def __init__(self, config_file='config.json', fast_start=False):
+        load_env()
+        
         with open(config_file, 'r') as f:
             self.config = json.load(f)
         
@@ -23,26 +35,84 @@ class CommutePredictor:
         self.work_station = self.config['tfl']['work_station']
         
         self.walking_mins = self.config['commute']['walking_minutes']
-        self.work_start = self.config['commute']['work_start_time']
-        self.buffer = self.config['commute']['buffer_minutes']
+        # Fall back to the keys api.py uses so the shipped configs work too
+        commute = self.config['commute']
+        self.work_start = commute.get('work_start_time', commute.get('arrival_target', '08:30'))
+        self.buffer = commute.get('buffer_minutes', commute.get('platform_buffer_minutes', 3))
         
-        # Get realistic journey time from TfL on startup
-        self.journey_mins = self.get_journey_time()
+        self.cache_file = os.path.join(os.path.dirname(os.path.abspath(config_file)), CACHE_FILE)
+        self.telegram_enabled = False
+        self.bot = None
+        self.chat_id = ''
+        self.last_alert_time = None
+        self.journey_source = None
+        self.telegram_setup = None
+        
+        if fast_start:
+            # Show the first board straight away from the cached/config
+            # journey time, and fetch the real one + set up Telegram in
+            # the background
+            self.journey_mins, self.journey_source = self.get_cached_journey_time()
+            startup = ThreadPoolExecutor(max_workers=2, thread_name_prefix='startup')
+            startup.submit(self.update_journey_time)
+            self.telegram_setup = startup.submit(self.setup_telegram)
+            startup.shutdown(wait=False)
+        else:
+            # Get realistic journey time from TfL on startup
+            self.journey_mins = self.get_journey_time()
+            self.setup_telegram()
+    
+    def setup_telegram(self):
+        """Telegram setup (optional) - only imports telegram if configured"""
+        bot_token = os.getenv('TELEGRAM_BOT_TOKEN', self.config.get('telegram', {}).get('bot_token', ''))
+        chat_id = os.getenv('TELEGRAM_CHAT_ID', self.config.get('telegram', {}).get('chat_id', ''))
+        if not (bot_token and chat_id):
+            return
         
-        # Telegram setup (optional)
         try:
-            bot_token = os.getenv('TELEGRAM_BOT_TOKEN', self.config.get('telegram', {}).get('bot_token', ''))
-            self.chat_id = os.getenv('TELEGRAM_CHAT_ID', self.config.get('telegram', {}).get('chat_id', ''))
+            from telegram import Bot
+            self.chat_id = chat_id
             self.bot = Bot(token=bot_token)
-            self.telegram_enabled = bool(bot_token and self.chat_id)
-        except:
+            self.telegram_enabled = True
+        except Exception as e:
+            print(f"⚠️  Telegram setup error: {e}")
             self.telegram_enabled = False
-        
-        self.last_alert_time = None
     
-    def get_journey_time(self):
+    def get_cached_journey_time(self):
+        """Journey time from the last successful TfL lookup, else config.
+        Returns (minutes, source) where source is 'cache' or 'config'."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            if cache.get('from') == self.station_id and cache.get('to') == self.work_station:
+                return cache['journey_mins'], 'cache'
+        except (OSError, ValueError, KeyError):
+            pass
+        return self.config['tfl'].get('journey_time_minutes', 18), 'config'
+    
+    def save_cached_journey_time(self, journey_mins):
+        """Remember the TfL journey time for the next fast start"""
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump({'from': self.station_id, 'to': self.work_station, 'journey_mins': journey_mins}, f)
+        except OSError as e:
+            print(f"⚠️  Couldn't save journey time cache: {e}")
+    
+    def update_journey_time(self):
+        """Background refresh of the journey time (fast start)"""
+        journey_mins = self.get_journey_time(fallback=self.journey_mins)
+        if journey_mins != self.journey_mins:
+            print(f"🔄 Journey time updated: {self.journey_mins} → {journey_mins} mins")
+        self.journey_mins = journey_mins
+    
+    def get_journey_time(self, fallback=None):
         """Get realistic journey time from TfL Journey Planner"""
+        if fallback is None:
+            fallback = self.config['tfl'].get('journey_time_minutes', 18)
+        
         try:
+            import requests
+            
             url = f"https://api.tfl.gov.uk/Journey/JourneyResults/{self.station_id}/to/{self.config['tfl']['work_station']}"
             params = {"app_key": self.tfl_key}
             
@@ -69,21 +139,21 @@ class CommutePredictor:
                             print(f"      {mode}, {duration} mins")
                 
                 print()
+                self.save_cached_journey_time(duration_mins)
                 return duration_mins
             else:
-                # Fallback to config
-                fallback = self.config['tfl'].get('journey_time_minutes', 18)
-                print(f"⚠️  Couldn't get journey time from TfL, using config: {fallback} mins\n")
+                print(f"⚠️  Couldn't get journey time from TfL, using fallback: {fallback} mins\n")
                 return fallback
                 
         except Exception as e:
-            fallback = self.config['tfl'].get('journey_time_minutes', 18)
             print(f"⚠️  Journey planner error: {e}")
-            print(f"   Using config fallback: {fallback} mins\n")
+            print(f"   Using fallback: {fallback} mins\n")
             return fallback
         
     def get_next_trains(self):
         """Get next trains from TfL API"""
+        import requests
+        
         url = f"https://api.tfl.gov.uk/StopPoint/{self.station_id}/Arrivals"
         params = {"app_key": self.tfl_key}
         
@@ -160,6 +230,10 @@ class CommutePredictor:
     
     async def send_notification(self, message):
         """Send Telegram notification"""
+        # Fast start: Telegram may still be setting up in the background
+        if self.telegram_setup:
+            await asyncio.wrap_future(self.telegram_setup)
+        
         if not self.telegram_enabled:
             return
             
@@ -169,16 +243,22 @@ class CommutePredictor:
         except Exception as e:
             print(f"⚠️  Notification error: {e}")
     
-    async def run(self):
-        """Main loop - runs continuously"""
+    def print_header(self):
+        """Startup summary shown above the first board"""
         print("🚇 Commute Predictor")
         print(f"📍 From: {self.station_id}")
         print(f"📍 To: {self.work_station}")
         print(f"🚶 Walking: {self.walking_mins} mins")
         print(f"🚇 Journey: {self.journey_mins} mins")
+        if self.journey_source:
+            print(f"   (from {self.journey_source} - refreshing from TfL in background)")
         print(f"🏢 Work start: {self.work_start}")
         print("=" * 60)
         print()
+    
+    async def run(self):
+        """Main loop - runs continuously"""
+        self.print_header()
         
         while True:
             try:
@@ -259,8 +339,12 @@ class CommutePredictor:
 if __name__ == "__main__":
     import sys
     
-    config_file = sys.argv[1] if len(sys.argv) > 1 else 'config.json'
+    args = sys.argv[1:]
+    fast_start = '--fast-start' in args
+    args = [a for a in args if a != '--fast-start']
+    
+    config_file = args[0] if args else 'config.json'
     print(f"📁 Config: {config_file}\n")
     
-    predictor = CommutePredictor(config_file)
+    predictor = CommutePredictor(config_file, fast_start=fast_start)
     asyncio.run(predictor.run())
\ No newline at end of file
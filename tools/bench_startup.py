@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for main.py - import time and time-to-first-board,
+normal vs --fast-start.
+
+Each run is a fresh python process so imports are cold.
+
+Usage: python3 tools/bench_startup.py [config.json] [runs]
+"""
+
+import os
+import subprocess
+import sys
+import json
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside a fresh interpreter, prints timings as JSON on a BENCH: line.
+# Fast start's background threads can still print after it, so don't rely
+# on it being the last line.
+SENTINEL = 'BENCH:'
+CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t_import = time.perf_counter() - t0
+
+t1 = time.perf_counter()
+predictor = main.CommutePredictor(sys.argv[1], fast_start=sys.argv[2] == 'fast')
+predictor.print_header()
+trains = predictor.get_next_trains()
+predictor.calculate_best_train(trains)
+t_board = time.perf_counter() - t1
+
+print('BENCH:' + json.dumps({'import': t_import, 'board': t_board, 'trains': len(trains)}))
+"""
+
+def run_once(config_file, mode):
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD, config_file, mode],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(f"❌ {mode} run failed")
+    for line in result.stdout.splitlines():
+        if line.startswith(SENTINEL):
+            return json.loads(line[len(SENTINEL):])
+    print(result.stdout)
+    sys.exit(f"❌ {mode} run printed no timings")
+
+def main():
+    config_file = os.path.abspath(sys.argv[1]) if len(sys.argv) > 1 else os.path.join(APP_DIR, 'config.json')
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    
+    print(f"📁 Config: {config_file}")
+    print(f"🔁 Runs: {runs}\n")
+    print(f"{'Mode':<8} {'import main':>12} {'first board':>12} {'total':>12}")
+    print("=" * 48)
+    
+    for mode in ('normal', 'fast'):
+        results = [run_once(config_file, mode) for _ in range(runs)]
+        avg = {key: sum(r[key] for r in results) / runs for key in ('import', 'board')}
+        total = avg['import'] + avg['board']
+        print(f"{mode:<8} {avg['import']*1000:>10.0f}ms {avg['board']*1000:>10.0f}ms {total*1000:>10.0f}ms")
+    
+    print()
+    print("import main  - time to import main.py (heavy deps are lazy)")
+    print("first board  - CommutePredictor() until the first arrivals board is ready,")
+    print("               including any imports and network calls on the way")
+
+if __name__ == "__main__":
+    main()